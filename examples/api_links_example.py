@@ -10,13 +10,53 @@ This example demonstrates how to:
 4. Create a unified documentation experience across multiple services
 """
 
+import sys
+import warnings
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import Any
 
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+from pydantic_core import to_json
 
 from fastmarkdocs import APILink, CodeLanguage, enhance_openapi_with_docs
 
+# Define the APIs available in your system, built once per process
+API_LINKS: tuple[APILink, ...] = (
+    APILink(url="/docs", description="Authentication"),
+    APILink(url="/api/users/docs", description="User Management"),
+    APILink(url="/api/orders/docs", description="Order Processing"),
+    APILink(url="/api/inventory/docs", description="Inventory"),
+    APILink(url="/api/payments/docs", description="Payments"),
+    APILink(url="/api/notifications/docs", description="Notifications"),
+    APILink(url="/api/analytics/docs", description="Analytics"),
+)
+
+# Bodies of the constant endpoints, serialized once instead of on every request
+_HEALTH_BODY = to_json({"status": "healthy"})
+_LOGIN_BODY = to_json({"message": "Login endpoint"})
+_USERS_BODY = to_json({"users": []})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the enhanced OpenAPI schema at startup so the first request doesn't pay for it."""
+    try:
+        app.openapi()
+    except Exception as e:
+        # A broken schema should only affect /openapi.json, not stop the app from serving
+        warnings.warn(f"Failed to pre-build the OpenAPI schema: {e}", stacklevel=2)
+    yield
+
+
+def short_operation_id(route: APIRoute) -> str:
+    """Use the handler name, prefixed by its first tag, as the operation ID."""
+    return f"{route.tags[0]}_{route.name}" if route.tags else route.name
+
 
 def create_enhanced_api_app() -> FastAPI:
     """Create a FastAPI app with enhanced documentation."""
@@ -25,49 +65,36 @@ def create_enhanced_api_app() -> FastAPI:
         title="Original API Title",  # This will be overridden
         description="Original description",  # This will be overridden
         version="1.0.0",
+        lifespan=lifespan,
+        generate_unique_id_function=short_operation_id,
     )
 
-    @app.get("/health")
-    async def health_check() -> dict[str, str]:
+    @app.get("/health", response_model=dict[str, str])
+    async def health_check() -> Response:
         """Health check endpoint."""
-        return {"status": "healthy"}
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
-    @app.get("/auth/login")
-    async def login() -> dict[str, str]:
+    @app.get("/auth/login", response_model=dict[str, str])
+    async def login() -> Response:
         """Login endpoint."""
-        return {"message": "Login endpoint"}
+        return Response(content=_LOGIN_BODY, media_type="application/json")
 
-    @app.get("/users")
-    async def get_users() -> dict[str, list[Any]]:
+    @app.get("/users", response_model=dict[str, list[Any]])
+    async def get_users() -> Response:
         """Get all users."""
-        return {"users": []}
+        return Response(content=_USERS_BODY, media_type="application/json")
 
-    def custom_openapi() -> dict[str, Any]:
-        """Generate custom OpenAPI schema with enhanced documentation."""
-        if app.openapi_schema:
-            return app.openapi_schema
-
-        # Define the APIs available in your system
-        apis = [
-            {"url": "/docs", "description": "Authentication"},
-            {"url": "/api/users/docs", "description": "User Management"},
-            {"url": "/api/orders/docs", "description": "Order Processing"},
-            {"url": "/api/inventory/docs", "description": "Inventory"},
-            {"url": "/api/payments/docs", "description": "Payments"},
-            {"url": "/api/notifications/docs", "description": "Notifications"},
-            {"url": "/api/analytics/docs", "description": "Analytics"},
-        ]
-
-        # Convert to APILink objects
-        api_links = [APILink(url=api["url"], description=api["description"]) for api in apis]
+    @lru_cache(maxsize=4)
+    def base_openapi(title: str, version: str, description: str) -> dict[str, Any]:
+        """Generate the base OpenAPI schema once per (title, version, description)."""
+        # All routes are registered above, before the app is returned, and never change afterwards
+        return get_openapi(title=title, version=version, description=description, routes=app.routes)
 
+    @lru_cache(maxsize=1)
+    def build_schema(title: str, version: str) -> dict[str, Any]:
+        """Build the enhanced OpenAPI schema once per (title, version)."""
         # Generate base OpenAPI schema
-        openapi_schema = get_openapi(
-            title=app.title,
-            version=app.version,
-            description=app.description,
-            routes=app.routes,
-        )
+        openapi_schema = base_openapi(title, version, app.description)
 
         # Enhance with FastMarkDocs and custom title/description/links
         enhanced_schema = enhance_openapi_with_docs(
@@ -81,11 +108,14 @@ def create_enhanced_api_app() -> FastAPI:
             # Enhanced documentation parameters
             app_title="My API Gateway",
             app_description="Comprehensive API management and authentication service",
-            api_links=api_links,
+            api_links=list(API_LINKS),
         )
 
-        app.openapi_schema = enhanced_schema
-        return app.openapi_schema
+        return enhanced_schema
+
+    def custom_openapi() -> dict[str, Any]:
+        """Generate custom OpenAPI schema with enhanced documentation."""
+        return build_schema(app.title, app.version)
 
     def set_custom_openapi() -> None:
         """Set the custom OpenAPI function on the app."""
@@ -103,11 +133,13 @@ def demonstrate_different_configurations() -> None:
         "info": {"title": "Original API", "version": "1.0.0", "description": "Original description"},
         "paths": {},
     }
+    # Safe to share across the calls below: enhance_openapi_with_docs works on its own copy
 
-    print("=== Different Configuration Examples ===\n")
+    # Collect output and write it once at the end instead of printing line by line
+    out: list[str] = ["=== Different Configuration Examples ===\n"]
 
     # Example 1: Full configuration with API links
-    print("1. Full configuration with API links:")
+    out.append("1. Full configuration with API links:")
     api_links = [
         APILink(url="/docs", description="Authentication"),
         APILink(url="/api/users/docs", description="User Management"),
@@ -122,11 +154,11 @@ def demonstrate_different_configurations() -> None:
         api_links=api_links,
     )
 
-    print(f"Title: {enhanced['info']['title']}")
-    print(f"Description:\n{enhanced['info']['description']}\n")
+    out.append(f"Title: {enhanced['info']['title']}")
+    out.append(f"Description:\n{enhanced['info']['description']}\n")
 
     # Example 2: Only API links
-    print("2. Only API links (preserves original title and description):")
+    out.append("2. Only API links (preserves original title and description):")
     enhanced2 = enhance_openapi_with_docs(
         openapi_schema=base_schema,
         docs_directory="docs",
@@ -136,11 +168,11 @@ def demonstrate_different_configurations() -> None:
         ],
     )
 
-    print(f"Title: {enhanced2['info']['title']}")
-    print(f"Description:\n{enhanced2['info']['description']}\n")
+    out.append(f"Title: {enhanced2['info']['title']}")
+    out.append(f"Description:\n{enhanced2['info']['description']}\n")
 
     # Example 3: Only title and description override
-    print("3. Only title and description override:")
+    out.append("3. Only title and description override:")
     enhanced3 = enhance_openapi_with_docs(
         openapi_schema=base_schema,
         docs_directory="docs",
@@ -148,11 +180,11 @@ def demonstrate_different_configurations() -> None:
         app_description="A specialized microservice for data processing",
     )
 
-    print(f"Title: {enhanced3['info']['title']}")
-    print(f"Description:\n{enhanced3['info']['description']}\n")
+    out.append(f"Title: {enhanced3['info']['title']}")
+    out.append(f"Description:\n{enhanced3['info']['description']}\n")
 
     # Example 4: Microservices architecture
-    print("4. Microservices architecture example:")
+    out.append("4. Microservices architecture example:")
     microservice_links = [
         APILink(url="/auth/docs", description="Authentication Service"),
         APILink(url="/user-service/docs", description="User Service"),
@@ -169,8 +201,10 @@ def demonstrate_different_configurations() -> None:
         api_links=microservice_links,
     )
 
-    print(f"Title: {enhanced4['info']['title']}")
-    print(f"Description:\n{enhanced4['info']['description']}\n")
+    out.append(f"Title: {enhanced4['info']['title']}")
+    out.append(f"Description:\n{enhanced4['info']['description']}\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
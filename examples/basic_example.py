@@ -5,26 +5,56 @@ Basic example demonstrating FastMarkDocs usage.
 
 This example shows how to enhance a FastAPI application with documentation
 loaded from markdown files.
+
+Run it against an installed FastMarkDocs (``pip install -e .`` from the
+repository root when working on a checkout).
 """
 
 import os
-import sys
+import warnings
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import cache, lru_cache
 from typing import Any, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.openapi.utils import get_openapi
-from pydantic import BaseModel
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
 
 from fastmarkdocs import (
     CodeLanguage,
+    MarkdownDocumentationLoader,
     enhance_openapi_with_docs,
 )
 
-# Add the src directory to the path so we can import the library
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the enhanced OpenAPI schema at startup so the first request doesn't pay for it."""
+    if not _DOCS_AVAILABLE:
+        warnings.warn(
+            f"Documentation directory not found, serving the plain OpenAPI schema: {DOCS_DIRECTORY}", stacklevel=2
+        )
+    app.openapi()
+    yield
+
+
+def short_operation_id(route: APIRoute) -> str:
+    """Use the handler name, prefixed by its first tag, as the operation ID."""
+    return f"{route.tags[0]}_{route.name}" if route.tags else route.name
+
 
 # Create FastAPI app
-app = FastAPI(title="Example API", description="An example API demonstrating FastMarkDocs", version="1.0.0")
+app = FastAPI(
+    title="Example API",
+    description="An example API demonstrating FastMarkDocs",
+    version="1.0.0",
+    lifespan=lifespan,
+    generate_unique_id_function=short_operation_id,
+)
 
 
 # Pydantic models
@@ -46,115 +76,158 @@ class UserUpdate(BaseModel):
     active: Optional[bool] = None
 
 
-# Sample data
-users_db = [
-    User(id=1, name="John Doe", email="john@example.com"),
-    User(id=2, name="Jane Smith", email="jane@example.com"),
-    User(id=3, name="Bob Johnson", email="bob@example.com", active=False),
-]
+# Body of the constant root endpoint, serialized once instead of on every request
+_ROOT_BODY = to_json({"message": "Welcome to the Example API", "docs": "/docs", "redoc": "/redoc"})
+
+# Sample data, keyed by ID (dicts keep insertion order, so listings stay stable)
+users_db: dict[int, User] = {
+    user.id: user
+    for user in (
+        User(id=1, name="John Doe", email="john@example.com"),
+        User(id=2, name="Jane Smith", email="jane@example.com"),
+        User(id=3, name="Bob Johnson", email="bob@example.com", active=False),
+    )
+}
+
+# Serializer for list responses; lets list_users skip FastAPI's per-item re-validation
+_user_list_adapter = TypeAdapter(list[User])
+
+# Encoded list_users bodies keyed by active_only, built on first request and
+# dropped on every write, so unchanged listings are not filtered or encoded again
+_user_list_bodies: dict[bool, bytes] = {}
+
+# Next ID to hand out; IDs are never reused, even after a delete
+_next_id = max(users_db, default=0) + 1
 
 
 # API Routes
-@app.get("/")
-async def root() -> dict[str, str]:
+@app.get("/", response_model=dict[str, str])
+async def root() -> Response:
     """Root endpoint returning API information."""
-    return {"message": "Welcome to the Example API", "docs": "/docs", "redoc": "/redoc"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/users", response_model=list[User])
-async def list_users(active_only: bool = True) -> list[User]:
+async def list_users(active_only: bool = True) -> Response:
     """List all users, optionally filtering by active status."""
-    if active_only:
-        return [user for user in users_db if user.active]
-    return users_db
+    body = _user_list_bodies.get(active_only)
+    if body is None:
+        # The items are already User instances, so dump them straight to JSON;
+        # response_model is kept for the OpenAPI schema only.
+        users = [user for user in users_db.values() if user.active or not active_only]
+        body = _user_list_bodies[active_only] = _user_list_adapter.dump_json(users)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/users/{user_id}", response_model=User)
 async def get_user(user_id: int) -> User:
     """Get a specific user by ID."""
-    for user in users_db:
-        if user.id == user_id:
-            return user
-    raise HTTPException(status_code=404, detail="User not found")
+    user = users_db.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
 
 
 @app.post("/users", response_model=User)
 async def create_user(user: UserCreate) -> User:
     """Create a new user."""
-    new_id = max(u.id for u in users_db) + 1 if users_db else 1
-    new_user = User(id=new_id, **user.dict())
-    users_db.append(new_user)
+    global _next_id
+    new_id = _next_id
+    _next_id += 1
+    new_user = User(id=new_id, **user.model_dump())
+    users_db[new_id] = new_user
+    _user_list_bodies.clear()
     return new_user
 
 
 @app.put("/users/{user_id}", response_model=User)
 async def update_user(user_id: int, user_update: UserUpdate) -> User:
     """Update an existing user."""
-    for i, user in enumerate(users_db):
-        if user.id == user_id:
-            update_data = user_update.dict(exclude_unset=True)
-            updated_user = user.copy(update=update_data)
-            users_db[i] = updated_user
-            return updated_user
-    raise HTTPException(status_code=404, detail="User not found")
+    user = users_db.get(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    update_data = user_update.model_dump(exclude_unset=True)
+    updated_user = user.model_copy(update=update_data)
+    users_db[user_id] = updated_user
+    _user_list_bodies.clear()
+    return updated_user
 
 
 @app.delete("/users/{user_id}")
 async def delete_user(user_id: int) -> dict[str, str]:
     """Delete a user."""
-    for i, user in enumerate(users_db):
-        if user.id == user_id:
-            deleted_user = users_db.pop(i)
-            return {"message": f"User {deleted_user.name} deleted successfully"}
-    raise HTTPException(status_code=404, detail="User not found")
+    deleted_user = users_db.pop(user_id, None)
+    if deleted_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    _user_list_bodies.clear()
+    return {"message": f"User {deleted_user.name} deleted successfully"}
 
 
 # Documentation enhancement
-def create_enhanced_openapi() -> dict[str, Any]:
-    """Create enhanced OpenAPI schema with markdown documentation."""
-    if app.openapi_schema:
-        return app.openapi_schema
+DOCS_DIRECTORY = os.path.join(os.path.dirname(__file__), "docs")
+
+# Checked once at import, so a missing docs directory doesn't go through the
+# enhancement error path on every schema build; lifespan warns about it at startup
+_DOCS_AVAILABLE = os.path.isdir(DOCS_DIRECTORY)
+
+
+@cache
+def _docs_loader(docs_directory: str, general_docs_file: str) -> MarkdownDocumentationLoader:
+    """Return the process-wide loader for a docs directory, so its parse cache is reused."""
+    return MarkdownDocumentationLoader(docs_directory, general_docs_file=general_docs_file)
 
+
+@lru_cache(maxsize=4)
+def _base_openapi(title: str, version: str, description: str) -> dict[str, Any]:
+    """Generate the base OpenAPI schema once per (title, version, description)."""
+    # Routes are all registered at import time and never change afterwards
+    return get_openapi(title=title, version=version, description=description, routes=app.routes)
+
+
+@lru_cache(maxsize=1)
+def _build_schema(title: str, version: str) -> dict[str, Any]:
+    """Build the enhanced OpenAPI schema once per (title, version)."""
     # Generate base OpenAPI schema
-    openapi_schema = get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
+    openapi_schema = _base_openapi(title, version, app.description)
+    if not _DOCS_AVAILABLE:
+        return openapi_schema
 
     try:
-        # Enhanced configuration using modern API
-        docs_directory = os.path.join(os.path.dirname(__file__), "docs")
-
         # Load documentation and enhance schema with modern API
         enhanced_schema = enhance_openapi_with_docs(
             openapi_schema=openapi_schema,
-            docs_directory=docs_directory,
+            docs_directory=DOCS_DIRECTORY,
             base_url="http://localhost:8000",
             include_code_samples=True,
             include_response_examples=True,
             code_sample_languages=[CodeLanguage.CURL, CodeLanguage.PYTHON, CodeLanguage.JAVASCRIPT],
             custom_headers={"User-Agent": "ExampleApp/1.0"},
             general_docs_file="general_docs.md",  # Optional: specify general documentation file
+            docs_loader=_docs_loader(DOCS_DIRECTORY, "general_docs.md"),
         )
 
         # Ensure we return a dict[str, Any]
         if isinstance(enhanced_schema, dict):
-            app.openapi_schema = enhanced_schema
             return enhanced_schema
         else:
             # Fallback if enhancement returns unexpected type
-            app.openapi_schema = openapi_schema
             return openapi_schema
 
     except Exception as e:
         # Fallback to original schema if enhancement fails
         print(f"Warning: Failed to enhance OpenAPI schema: {e}")
-        app.openapi_schema = openapi_schema
         return openapi_schema
 
 
+def create_enhanced_openapi() -> dict[str, Any]:
+    """Create enhanced OpenAPI schema with markdown documentation."""
+    # The lru_cache survives app.openapi_schema being cleared (tests, reloads),
+    # so markdown files are parsed only once per process.
+    return _build_schema(app.title, app.version)
+
+
 # Set the custom OpenAPI function
 def set_custom_openapi() -> None:
     """Set the custom OpenAPI function on the app."""
@@ -163,6 +236,7 @@ def set_custom_openapi() -> None:
 
 set_custom_openapi()
 
+
 if __name__ == "__main__":
     import uvicorn
 
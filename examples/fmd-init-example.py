@@ -8,18 +8,13 @@ existing FastAPI projects.
 """
 
 import tempfile
+from collections import Counter
 from pathlib import Path
 
 from fastmarkdocs.scaffolder import DocumentationInitializer
 
-
-def create_sample_fastapi_project(project_dir: Path) -> None:
-    """Create a sample FastAPI project structure for demonstration."""
-
-    # Create main API file
-    main_api = project_dir / "main.py"
-    main_api.write_text(
-        '''
+# Source files of the sample project, as (relative path, UTF-8 bytes); encoded once at import
+_MAIN_PY = '''
 """Main FastAPI application."""
 
 from fastapi import FastAPI, HTTPException
@@ -145,15 +140,8 @@ def delete_user(user_id: int):
     """Delete a user by ID."""
     return {"message": f"User {user_id} deleted successfully"}
 '''
-    )
-
-    # Create API router file
-    api_dir = project_dir / "api"
-    api_dir.mkdir()
 
-    orders_router = api_dir / "orders.py"
-    orders_router.write_text(
-        '''
+_ORDERS_ROUTER_PY = '''
 """Orders API router."""
 
 from fastapi import APIRouter, HTTPException
@@ -259,12 +247,8 @@ def cancel_order(order_id: int):
     """Cancel an order."""
     return {"message": f"Order {order_id} cancelled successfully"}
 '''
-    )
 
-    # Create admin router
-    admin_router = api_dir / "admin.py"
-    admin_router.write_text(
-        '''
+_ADMIN_ROUTER_PY = '''
 """Admin API router."""
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -319,7 +303,20 @@ def get_system_logs(level: str = "info", limit: int = 100):
         "total_count": 1500
     }
 '''
-    )
+
+SAMPLE_PROJECT_FILES: tuple[tuple[str, bytes], ...] = (
+    ("main.py", _MAIN_PY.encode("utf-8")),
+    ("api/orders.py", _ORDERS_ROUTER_PY.encode("utf-8")),
+    ("api/admin.py", _ADMIN_ROUTER_PY.encode("utf-8")),
+)
+
+
+def create_sample_fastapi_project(project_dir: Path) -> None:
+    """Create a sample FastAPI project structure for demonstration."""
+    for relative_path, content in SAMPLE_PROJECT_FILES:
+        file_path = project_dir / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
 
 
 def demonstrate_programmatic_usage() -> None:
@@ -347,30 +344,27 @@ def demonstrate_programmatic_usage() -> None:
         print(f"   📄 Files generated: {len(result.get('files', []))}")
 
         print("\n📋 Generated files:")
-        for file_path in result["files_generated"].keys():
+        for file_path in result["files"]:
             print(f"   - {file_path}")
 
         print("\n📈 Endpoint breakdown:")
-        endpoints = result.get("endpoints", [])
-        method_counts: dict[str, int] = {}
-        for endpoint in endpoints:
-            method_counts[endpoint.method] = method_counts.get(endpoint.method, 0) + 1
+        method_counts = Counter(endpoint.method for endpoint in result.get("endpoints", []))
 
         for method, count in sorted(method_counts.items()):
             print(f"   {method}: {count}")
 
         # Show sample of generated content
-        if result["files_generated"]:
-            first_file = list(result["files_generated"].keys())[0]
-            content = result["files_generated"][first_file]
+        if result["files"]:
+            first_file = result["files"][0]
+            content = Path(first_file).read_text(encoding="utf-8")
 
             print(f"\n📝 Sample content from {Path(first_file).name}:")
             print("-" * 40)
-            # Show first 10 lines
-            lines = content.split("\n")[:10]
-            for line in lines:
+            # Show first 10 lines; maxsplit stops splitting once there is an 11th piece
+            head = content.split("\n", 10)
+            for line in head[:10]:
                 print(f"   {line}")
-            if len(content.split("\n")) > 10:
+            if len(head) > 10:
                 print("   ...")
 
 
@@ -8,12 +8,18 @@ code samples in multiple programming languages from API endpoint definitions.
 """
 
 import json
+import warnings
+from collections.abc import Callable, Iterable
+from functools import partial
 from typing import Any, Optional
 from urllib.parse import urlencode, urljoin
 
 from .exceptions import CodeSampleGenerationError
 from .types import CodeLanguage, CodeSample, CodeSampleTemplate, EndpointDocumentation, HTTPMethod
 
+# Generates one language sample for an endpoint
+_SampleGenerator = Callable[[EndpointDocumentation], Optional[CodeSample]]
+
 
 class CodeSampleGenerator:
     """
@@ -75,30 +81,71 @@ class CodeSampleGenerator:
         Raises:
             CodeSampleGenerationError: If generation fails
         """
+        return self._generate_samples(endpoint, self._language_generators())
+
+    def generate_samples_for_endpoints(
+        self, endpoints: Iterable[EndpointDocumentation], skip_failed: bool = False
+    ) -> list[CodeSample]:
+        """
+        Generate code samples for several endpoints in all configured languages.
+
+        The per-language generator methods are resolved once for the whole batch
+        instead of once per endpoint.
+
+        Args:
+            endpoints: Endpoint documentation to generate samples for
+            skip_failed: Warn about and skip endpoints whose generation fails instead of raising
+
+        Returns:
+            Generated code samples, grouped by endpoint in input order
+
+        Raises:
+            CodeSampleGenerationError: If generation fails for any endpoint and skip_failed is False
+        """
+        generators = self._language_generators()
+        samples: list[CodeSample] = []
+        for endpoint in endpoints:
+            try:
+                samples.extend(self._generate_samples(endpoint, generators))
+            except CodeSampleGenerationError as e:
+                if not skip_failed:
+                    raise
+                warnings.warn(f"Skipping code samples for endpoint: {e}", stacklevel=2)
+        return samples
+
+    def _language_generators(self) -> list[tuple[CodeLanguage, _SampleGenerator]]:
+        """Resolve the sample generator method for each configured language."""
+        generators_by_language: dict[CodeLanguage, _SampleGenerator] = {
+            CodeLanguage.CURL: self.generate_curl_sample,
+            CodeLanguage.PYTHON: self.generate_python_sample,
+            CodeLanguage.JAVASCRIPT: self.generate_javascript_sample,
+            CodeLanguage.TYPESCRIPT: self.generate_typescript_sample,
+            CodeLanguage.GO: self.generate_go_sample,
+            CodeLanguage.JAVA: self.generate_java_sample,
+            CodeLanguage.PHP: self.generate_php_sample,
+            CodeLanguage.RUBY: self.generate_ruby_sample,
+            CodeLanguage.CSHARP: self.generate_csharp_sample,
+        }
+        return [
+            (
+                language,
+                generators_by_language.get(language)
+                or partial(self._generate_sample_for_language, language=language.value),
+            )
+            for language in self.code_sample_languages
+        ]
+
+    def _generate_samples(
+        self,
+        endpoint: EndpointDocumentation,
+        generators: list[tuple[CodeLanguage, _SampleGenerator]],
+    ) -> list[CodeSample]:
+        """Run the resolved language generators for one endpoint."""
         samples = []
 
-        for language in self.code_sample_languages:
+        for language, generate in generators:
             try:
-                if language == CodeLanguage.CURL:
-                    sample = self.generate_curl_sample(endpoint)
-                elif language == CodeLanguage.PYTHON:
-                    sample = self.generate_python_sample(endpoint)
-                elif language == CodeLanguage.JAVASCRIPT:
-                    sample = self.generate_javascript_sample(endpoint)
-                elif language == CodeLanguage.TYPESCRIPT:
-                    sample = self.generate_typescript_sample(endpoint)
-                elif language == CodeLanguage.GO:
-                    sample = self.generate_go_sample(endpoint)
-                elif language == CodeLanguage.JAVA:
-                    sample = self.generate_java_sample(endpoint)
-                elif language == CodeLanguage.PHP:
-                    sample = self.generate_php_sample(endpoint)
-                elif language == CodeLanguage.RUBY:
-                    sample = self.generate_ruby_sample(endpoint)
-                elif language == CodeLanguage.CSHARP:
-                    sample = self.generate_csharp_sample(endpoint)
-                else:
-                    sample = self._generate_sample_for_language(endpoint, language.value)
+                sample = generate(endpoint)
 
                 if sample:
                     samples.append(sample)
@@ -7,6 +7,7 @@ This module provides the MarkdownDocumentationLoader class for loading
 and parsing markdown documentation files into structured data.
 """
 
+import fnmatch
 import os
 import re
 import threading
@@ -14,11 +15,11 @@ import time
 from pathlib import Path
 from typing import Any, Optional
 
-import mistune
 import yaml
 
 from .exceptions import DocumentationLoadError
 from .types import (
+    ALL_CODE_LANGUAGES,
     CodeLanguage,
     CodeSample,
     DocumentationData,
@@ -36,6 +37,19 @@ from .utils import (
     validate_markdown_structure,
 )
 
+# Patterns used while scanning markdown line by line, compiled once at import
+_ENDPOINT_HEADER_RE = re.compile(r"^(#{2,4})\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+/")
+_HEADER_RE = re.compile(r"^(#{1,})\s+")
+_TOP_LEVEL_HEADER_RE = re.compile(r"^(#{1,2})\s+")
+_SUBSECTION_HEADER_RE = re.compile(r"^#{3,4}\s+")
+_RESPONSE_EXAMPLES_HEADER_RE = re.compile(r"^#{3,4}\s*Response\s+Examples?", re.IGNORECASE)
+_STATUS_CODE_RE = re.compile(r".*\((\d+).*\).*:")
+_RESPONSE_DESCRIPTION_RE = re.compile(r"\*\*(.*?)\s*\(\d+.*\):")
+_RESPONSE_DESCRIPTION_FALLBACK_RE = re.compile(r"\*\*(.*?)\s*\(")
+_PARAMETERS_HEADER_RE = re.compile(r"^#{3,4}\s*(Parameters?|Query Parameters?|Path Parameters?)", re.IGNORECASE)
+_PARAMETER_LINE_RE = re.compile(r"^\s*-\s*`([^`]+)`\s*\(([^,)]+)(?:,\s*(required|optional))?\):\s*(.+)")
+_SECTION_LINE_RE = re.compile(r"^Section:\s*(.+)", re.IGNORECASE)
+
 
 class MarkdownDocumentationLoader:
     """
@@ -57,6 +71,7 @@ class MarkdownDocumentationLoader:
         cache_enabled: bool = True,
         cache_ttl: int = 3600,
         general_docs_file: Optional[str] = None,
+        sources: Optional[dict[str, str]] = None,
     ):
         """
         Initialize the documentation loader.
@@ -71,19 +86,22 @@ class MarkdownDocumentationLoader:
             cache_enabled: Whether to enable caching
             cache_ttl: Cache time-to-live in seconds
             general_docs_file: Path to general documentation file (defaults to "general_docs.md" if found)
+            sources: In-memory markdown documents keyed by file name; when given, they are parsed
+                instead of reading files from docs_directory
         """
         self.docs_directory = Path(docs_directory)
         self.base_url_placeholder = base_url_placeholder
-        self.supported_languages = supported_languages or list(CodeLanguage)
+        self.supported_languages = supported_languages or list(ALL_CODE_LANGUAGES)
         self.file_patterns = file_patterns or ["*.md", "*.markdown"]
         self.encoding = encoding
         self.recursive = recursive
         self.cache_enabled = cache_enabled
         self.cache_ttl = cache_ttl
         self.general_docs_file = general_docs_file
+        self.sources = dict(sources) if sources is not None else None
 
         # Validate directory exists during initialization (only for absolute paths)
-        if self.docs_directory.is_absolute() and not self.docs_directory.exists():
+        if self.sources is None and self.docs_directory.is_absolute() and not self.docs_directory.exists():
             raise DocumentationLoadError(str(self.docs_directory), "Documentation directory does not exist")
 
         self._cache: dict[str, dict[str, Any]] = {}
@@ -93,7 +111,6 @@ class MarkdownDocumentationLoader:
         self._cache_lock = threading.Lock()
         self._loading_event = threading.Event()
         self._is_loading = False
-        self._markdown_parser = mistune.create_markdown(renderer="ast")
         self._general_docs_content: Optional[str] = None
 
     def load_documentation(self) -> DocumentationData:
@@ -180,13 +197,17 @@ class MarkdownDocumentationLoader:
         try:
             # Normalize the docs directory path
             docs_path = normalize_path(str(self.docs_directory))
+            sources = self.sources
 
-            if not os.path.exists(docs_path):
+            if sources is None and not os.path.exists(docs_path):
                 raise DocumentationLoadError(docs_path, "Documentation directory does not exist")
 
             # Load general documentation content if available
             try:
-                self._general_docs_content = self._load_general_docs(docs_path)
+                if sources is not None:
+                    self._general_docs_content = self._load_general_docs_from_sources(sources)
+                else:
+                    self._general_docs_content = self._load_general_docs(docs_path)
             except Exception as e:
                 # Log warning but don't fail - general docs are optional
                 import warnings
@@ -194,8 +215,15 @@ class MarkdownDocumentationLoader:
                 warnings.warn(f"Failed to load general docs: {str(e)}", stacklevel=2)
                 self._general_docs_content = None
 
-            # Find all markdown files
-            markdown_files = find_markdown_files(docs_path, self.file_patterns, self.recursive)
+            # Find all markdown files (or in-memory sources matching the file patterns)
+            if sources is not None:
+                markdown_files = [
+                    name
+                    for name in sources
+                    if any(fnmatch.fnmatch(os.path.basename(name), pattern) for pattern in self.file_patterns)
+                ]
+            else:
+                markdown_files = find_markdown_files(docs_path, self.file_patterns, self.recursive)
 
             if not markdown_files:
                 # Return empty documentation instead of raising error
@@ -212,7 +240,10 @@ class MarkdownDocumentationLoader:
 
             for file_path in markdown_files:
                 try:
-                    file_data = self._load_file(file_path)
+                    if sources is not None:
+                        file_data = self._load_source(file_path, sources[file_path])
+                    else:
+                        file_data = self._load_file(file_path)
 
                     # Extract multiple endpoints from content
                     file_endpoints = self._extract_endpoints_from_content(file_data["content"])
@@ -341,31 +372,11 @@ class MarkdownDocumentationLoader:
             with open(file_path, encoding=self.encoding) as f:
                 content = f.read()
 
-            # Extract YAML frontmatter if present
-            frontmatter_metadata, content_without_frontmatter = self._extract_frontmatter(content)
-
-            # Parse markdown content
-            ast = self._markdown_parser(content_without_frontmatter)
-
-            # Extract various components
-            endpoint_info = extract_endpoint_info(content_without_frontmatter, self._general_docs_content)
-            code_samples = extract_code_samples(content_without_frontmatter, self.supported_languages)
-            validation_errors = validate_markdown_structure(content_without_frontmatter, file_path)
-
-            # Create file data
-            file_data = {
-                "file_path": file_path,
-                "content": content_without_frontmatter,
-                "ast": ast,
-                "endpoint_info": endpoint_info,
-                "code_samples": code_samples,
-                "validation_errors": validation_errors,
-                "metadata": {
-                    "file_size": os.path.getsize(file_path),
-                    "modified_time": os.path.getmtime(file_path),
-                    **frontmatter_metadata,  # Include YAML frontmatter metadata
-                },
-            }
+            file_data = self._parse_content(
+                file_path,
+                content,
+                {"file_size": os.path.getsize(file_path), "modified_time": os.path.getmtime(file_path)},
+            )
 
             # Cache the result if caching is enabled
             if self.cache_enabled:
@@ -381,6 +392,68 @@ class MarkdownDocumentationLoader:
         except Exception as e:
             raise DocumentationLoadError(file_path, f"Unexpected error: {str(e)}") from e
 
+    def _load_source(self, name: str, content: str) -> dict[str, Any]:
+        """
+        Parse an in-memory markdown source.
+
+        Args:
+            name: Name of the source (used where a file path would be)
+            content: Markdown content of the source
+
+        Returns:
+            Dictionary containing parsed file data
+        """
+        return self._parse_content(name, content, {"file_size": len(content.encode(self.encoding))})
+
+    def _parse_content(self, file_path: str, content: str, file_metadata: dict[str, Any]) -> dict[str, Any]:
+        """
+        Parse markdown content into the file data structure shared by files and in-memory sources.
+
+        Args:
+            file_path: Path (or source name) the content came from
+            content: Raw markdown content, including any frontmatter
+            file_metadata: File-level metadata such as size and modification time
+
+        Returns:
+            Dictionary containing parsed file data
+        """
+        # Extract YAML frontmatter if present
+        frontmatter_metadata, content_without_frontmatter = self._extract_frontmatter(content)
+
+        # Extract various components; these scan the raw text directly, so no markdown AST is built
+        endpoint_info = extract_endpoint_info(content_without_frontmatter, self._general_docs_content)
+        code_samples = extract_code_samples(content_without_frontmatter, self.supported_languages)
+        validation_errors = validate_markdown_structure(content_without_frontmatter, file_path)
+
+        return {
+            "file_path": file_path,
+            "content": content_without_frontmatter,
+            "endpoint_info": endpoint_info,
+            "code_samples": code_samples,
+            "validation_errors": validation_errors,
+            "metadata": {
+                **file_metadata,
+                **frontmatter_metadata,  # Include YAML frontmatter metadata
+            },
+        }
+
+    def _load_general_docs_from_sources(self, sources: dict[str, str]) -> Optional[str]:
+        """
+        Load general documentation content from in-memory sources if available.
+
+        Args:
+            sources: In-memory markdown documents keyed by file name
+
+        Returns:
+            General documentation content or None if not found
+        """
+        content = sources.get(self.general_docs_file or "general_docs.md")
+        if content is None:
+            return None
+
+        _, content_without_frontmatter = self._extract_frontmatter(content)
+        return content_without_frontmatter
+
     def _load_general_docs(self, docs_path: str) -> Optional[str]:
         """
         Load general documentation content if available.
@@ -522,7 +595,7 @@ class MarkdownDocumentationLoader:
 
             # Check if this line is an endpoint header (only if not in code block)
             if not in_code_block:
-                endpoint_match = re.match(r"^(#{2,4})\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+/", line)
+                endpoint_match = _ENDPOINT_HEADER_RE.match(line)
                 if endpoint_match:
                     # If we have a current section, save it
                     if current_section:
@@ -536,14 +609,14 @@ class MarkdownDocumentationLoader:
 
                 # Check if this line is a header that would end the current endpoint section
                 if current_section and current_endpoint_level > 0:
-                    header_match = re.match(r"^(#{1,})\s+", line)
+                    header_match = _HEADER_RE.match(line)
                     if header_match:
                         header_level = len(header_match.group(1))
                         # Only end the section if we encounter a header at the same level or higher (fewer #'s)
                         # that is NOT a sub-section of the current endpoint (like #### Code Examples)
                         if header_level <= current_endpoint_level:
                             # Check if this is another endpoint header
-                            if not re.match(r"^#{2,4}\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+/", line):
+                            if not _ENDPOINT_HEADER_RE.match(line):
                                 # This is a non-endpoint header at same/higher level
                                 # But we should NOT split on sub-headers like "#### Code Examples"
                                 # Only split on major section headers (# or ## level)
@@ -591,12 +664,12 @@ class MarkdownDocumentationLoader:
         for line_num, line in enumerate(lines, 1):
             try:
                 # Check for Response Examples section (more flexible matching)
-                if re.match(r"^#{3,4}\s*Response\s+Examples?", line, re.IGNORECASE):
+                if _RESPONSE_EXAMPLES_HEADER_RE.match(line):
                     in_response_section = True
                     continue
 
                 # Check for next section (exit response examples)
-                if in_response_section and re.match(r"^#{3,4}\s+", line):
+                if in_response_section and _SUBSECTION_HEADER_RE.match(line):
                     # Before exiting, handle any unclosed code block
                     if in_code_block and current_code:
                         self._finalize_response_example(
@@ -610,7 +683,7 @@ class MarkdownDocumentationLoader:
                 if in_response_section:
                     # Check for response description lines with status codes
                     # Enhanced pattern to handle more variations
-                    status_match = re.search(r".*\((\d+).*\).*:", line)
+                    status_match = _STATUS_CODE_RE.search(line)
                     if (
                         status_match
                         and line.strip().startswith("**")
@@ -626,12 +699,12 @@ class MarkdownDocumentationLoader:
 
                         current_status = int(status_match.group(1))
                         # Extract description from the line with better parsing
-                        desc_match = re.search(r"\*\*(.*?)\s*\(\d+.*\):", line)
+                        desc_match = _RESPONSE_DESCRIPTION_RE.search(line)
                         if desc_match:
                             current_description = desc_match.group(1).strip()
                         else:
                             # Fallback: extract everything before the status code
-                            fallback_match = re.search(r"\*\*(.*?)\s*\(", line)
+                            fallback_match = _RESPONSE_DESCRIPTION_FALLBACK_RE.search(line)
                             current_description = (
                                 fallback_match.group(1).strip()
                                 if fallback_match
@@ -773,18 +846,18 @@ class MarkdownDocumentationLoader:
 
         for line in lines:
             # Check for parameters section header
-            if re.match(r"^#{3,4}\s*(Parameters?|Query Parameters?|Path Parameters?)", line, re.IGNORECASE):
+            if _PARAMETERS_HEADER_RE.match(line):
                 in_parameters_section = True
                 continue
 
             # Check for next section (exit parameters)
-            if in_parameters_section and re.match(r"^#{3,4}\s+", line):
+            if in_parameters_section and _SUBSECTION_HEADER_RE.match(line):
                 in_parameters_section = False
                 continue
 
             if in_parameters_section:
                 # Parse parameter lines (- `name` (type, required): description)
-                param_match = re.match(r"^\s*-\s*`([^`]+)`\s*\(([^,)]+)(?:,\s*(required|optional))?\):\s*(.+)", line)
+                param_match = _PARAMETER_LINE_RE.match(line)
                 if param_match:
                     name = param_match.group(1)
                     param_type = param_match.group(2)
@@ -818,7 +891,7 @@ class MarkdownDocumentationLoader:
 
         for line in lines:
             # Extract sections from "Section:" lines
-            section_match = re.match(r"^Section:\s*(.+)", line, re.IGNORECASE)
+            section_match = _SECTION_LINE_RE.match(line)
             if section_match:
                 sections = [section.strip() for section in section_match.group(1).split(",")]
                 file_sections.update(sections)
@@ -862,7 +935,7 @@ class MarkdownDocumentationLoader:
 
             # Stop collecting when we hit the next major section
             if in_overview:
-                header_match = re.match(r"^(#{1,2})\s+", line)
+                header_match = _TOP_LEVEL_HEADER_RE.match(line)
                 if header_match:
                     # This is an h1 or h2 header, stop overview collection
                     break
@@ -4,6 +4,7 @@ FastMarkDocs Documentation Linter
 Core linting functionality for analyzing FastAPI documentation completeness and accuracy.
 """
 
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -170,6 +171,9 @@ class DocumentationLinter:
             return [self._make_json_serializable(item) for item in obj]
         elif isinstance(obj, dict):
             return {key: self._make_json_serializable(value) for key, value in obj.items()}
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclasses have no __dict__
+            return {f.name: self._make_json_serializable(getattr(obj, f.name)) for f in fields(obj)}
         elif hasattr(obj, "__dict__"):
             # Convert dataclass or object to dict
             return {key: self._make_json_serializable(value) for key, value in obj.__dict__.items()}
@@ -27,6 +27,30 @@ from .types import (
 )
 
 
+def _copy_schema(value: Any) -> Any:
+    """
+    Copy a JSON-shaped OpenAPI schema.
+
+    Plain dicts and lists are rebuilt recursively and immutable scalars are shared, which is much
+    cheaper than copy.deepcopy's memo bookkeeping; anything else (including dict/list subclasses)
+    falls back to copy.deepcopy.
+
+    Args:
+        value: Schema (or schema fragment) to copy
+
+    Returns:
+        An independent copy of the value
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_schema(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_schema(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return copy.deepcopy(value)
+
+
 def _build_description_with_general_docs(
     app_title: Optional[str] = None,
     app_description: Optional[str] = None,
@@ -74,6 +98,7 @@ def enhance_openapi_with_docs(
     app_title: Optional[str] = None,
     app_description: Optional[str] = None,
     general_docs_file: Optional[str] = None,
+    docs_loader: Optional[MarkdownDocumentationLoader] = None,
 ) -> dict[str, Any]:
     """
     Enhance an OpenAPI schema with documentation from markdown files.
@@ -89,6 +114,8 @@ def enhance_openapi_with_docs(
         app_title: Application title
         app_description: Application description
         general_docs_file: Path to general documentation file (defaults to "general_docs.md" if found)
+        docs_loader: Existing loader to reuse (and whose cache to reuse) instead of creating one;
+            docs_directory and general_docs_file are ignored when it is given
 
     Returns:
         Enhanced OpenAPI schema
@@ -97,8 +124,9 @@ def enhance_openapi_with_docs(
         OpenAPIEnhancementError: If enhancement fails
     """
     try:
-        # Create documentation loader
-        docs_loader = MarkdownDocumentationLoader(docs_directory, general_docs_file=general_docs_file)
+        # Create documentation loader unless the caller supplied one
+        if docs_loader is None:
+            docs_loader = MarkdownDocumentationLoader(docs_directory, general_docs_file=general_docs_file)
 
         # Create enhancement config
         OpenAPIEnhancementConfig(
@@ -245,7 +273,7 @@ class OpenAPIEnhancer:
 
         try:
             # Create a deep copy to avoid modifying the original
-            enhanced_schema = copy.deepcopy(openapi_schema)
+            enhanced_schema: dict[str, Any] = _copy_schema(openapi_schema)
 
             # Initialize unified analyzer for this schema
             self.analyzer = UnifiedEndpointAnalyzer(openapi_schema, base_url=self.base_url)
@@ -7,10 +7,14 @@ This module contains all type definitions, enums, and data classes used througho
 the library for type safety and better IDE support.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional, Union
 
+# Slotted dataclasses drop the per-instance __dict__; dataclass(slots=...) needs Python 3.10+
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class CodeLanguage(str, Enum):
     """Supported code sample languages."""
@@ -25,8 +29,8 @@ class CodeLanguage(str, Enum):
     RUBY = "ruby"
     CSHARP = "csharp"
 
-    def __str__(self) -> str:
-        return self.value
+    # str() and f-strings yield the plain value; bound to the C-level str slot instead of a Python method
+    __str__ = str.__str__
 
 
 class HTTPMethod(str, Enum):
@@ -40,11 +44,20 @@ class HTTPMethod(str, Enum):
     HEAD = "HEAD"
     OPTIONS = "OPTIONS"
 
-    def __str__(self) -> str:
-        return self.value
+    # str() and f-strings yield the plain value; bound to the C-level str slot instead of a Python method
+    __str__ = str.__str__
+
+
+# Language defaults, built once; configs copy them into fresh lists instead of walking the enum
+ALL_CODE_LANGUAGES: tuple[CodeLanguage, ...] = tuple(CodeLanguage)
+DEFAULT_CODE_SAMPLE_LANGUAGES: tuple[CodeLanguage, ...] = (
+    CodeLanguage.CURL,
+    CodeLanguage.PYTHON,
+    CodeLanguage.JAVASCRIPT,
+)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CodeSample:
     """Represents a code sample extracted from markdown."""
 
@@ -58,7 +71,7 @@ class CodeSample:
             raise ValueError("Code cannot be empty")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class APILink:
     """Represents a link to another API in the system."""
 
@@ -72,7 +85,7 @@ class APILink:
             raise ValueError("Description cannot be empty")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ResponseExample:
     """Enhanced response example supporting multiple content types."""
 
@@ -168,7 +181,7 @@ class ResponseExample:
             self.content = self.raw_content
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ParameterDocumentation:
     """Documentation for a single parameter."""
 
@@ -181,9 +194,15 @@ class ParameterDocumentation:
     def __post_init__(self) -> None:
         if not self.name:
             raise ValueError("Parameter name cannot be empty")
+        # Names and types repeat across endpoints; share one string object per distinct value.
+        # sys.intern only accepts exact str, so str subclasses are kept as given.
+        if type(self.name) is str:
+            object.__setattr__(self, "name", sys.intern(self.name))
+        if type(self.type) is str:
+            object.__setattr__(self, "type", sys.intern(self.type))
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TagDescription:
     """Represents a tag with its description from markdown overview sections."""
 
@@ -197,7 +216,7 @@ class TagDescription:
             raise ValueError("Tag description cannot be empty")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EndpointDocumentation:
     """Complete documentation for an API endpoint."""
 
@@ -217,8 +236,25 @@ class EndpointDocumentation:
         if not isinstance(self.method, HTTPMethod):
             raise TypeError("Method must be an HTTPMethod enum value")
 
+    @property
+    def path_prefix(self) -> str:
+        """First segment of the path (e.g. ``/api`` for ``/api/users/{id}``), used to group endpoints by area."""
+        # A property rather than cached_property: the class is slotted and path may be reassigned
+        _, slash, rest = self.path.partition("/")
+        return "/" + rest.partition("/")[0] if slash else self.path
+
+
+# Dictionary-style keys accepted by DocumentationData.__getitem__, mapped to attribute names
+_DOCUMENTATION_DATA_KEYS: dict[str, str] = {
+    "endpoints": "endpoints",
+    "global_examples": "global_examples",
+    "metadata": "metadata",
+    "section_descriptions": "section_descriptions",
+    "tag_descriptions": "section_descriptions",  # Backward compatibility
+}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class DocumentationData:
     """Container for all documentation data loaded from markdown files."""
 
@@ -229,27 +265,19 @@ class DocumentationData:
 
     def __getitem__(self, key: str) -> Any:
         """Allow dictionary-style access for backwards compatibility."""
-        if key == "endpoints":
-            return self.endpoints
-        elif key == "global_examples":
-            return self.global_examples
-        elif key == "metadata":
-            return self.metadata
-        elif key == "section_descriptions":
-            return self.section_descriptions
-        elif key == "tag_descriptions":  # Backward compatibility
-            return self.section_descriptions
-        else:
+        attribute = _DOCUMENTATION_DATA_KEYS.get(key)
+        if attribute is None:
             raise KeyError(f"'{key}' not found in DocumentationData")
+        return getattr(self, attribute)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MarkdownDocumentationConfig:
     """Configuration for markdown documentation loading."""
 
     docs_directory: str = "docs"
     base_url_placeholder: str = "https://api.example.com"
-    supported_languages: list[CodeLanguage] = field(default_factory=lambda: list(CodeLanguage))
+    supported_languages: list[CodeLanguage] = field(default_factory=lambda: list(ALL_CODE_LANGUAGES))
     file_patterns: list[str] = field(default_factory=lambda: ["*.md", "*.markdown"])
     encoding: str = "utf-8"
     recursive: bool = True
@@ -257,16 +285,14 @@ class MarkdownDocumentationConfig:
     cache_ttl: int = 3600
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OpenAPIEnhancementConfig:
     """Enhanced configuration for OpenAPI schema enhancement supporting multiple content types."""
 
     include_code_samples: bool = True
     include_response_examples: bool = True
     include_parameter_examples: bool = True
-    code_sample_languages: list[CodeLanguage] = field(
-        default_factory=lambda: [CodeLanguage.CURL, CodeLanguage.PYTHON, CodeLanguage.JAVASCRIPT]
-    )
+    code_sample_languages: list[CodeLanguage] = field(default_factory=lambda: list(DEFAULT_CODE_SAMPLE_LANGUAGES))
     base_url: Optional[str] = "https://api.example.com"
     server_urls: list[str] = field(default_factory=lambda: ["https://api.example.com"])
     custom_headers: dict[str, str] = field(default_factory=dict)
@@ -287,7 +313,7 @@ class OpenAPIEnhancementConfig:
     validate_content_format: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CodeSampleTemplate:
     """Template for generating code samples."""
 
@@ -298,7 +324,7 @@ class CodeSampleTemplate:
     cleanup_code: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ValidationError:
     """Represents a validation error in documentation."""
 
@@ -308,8 +334,13 @@ class ValidationError:
     message: str
     suggestion: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Validation runs produce many errors from a small set of error types
+        if type(self.error_type) is str:
+            object.__setattr__(self, "error_type", sys.intern(self.error_type))
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class DocumentationStats:
     """Statistics about loaded documentation."""
 
@@ -321,7 +352,7 @@ class DocumentationStats:
     load_time_ms: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EnhancementResult:
     """Result of OpenAPI schema enhancement."""
 
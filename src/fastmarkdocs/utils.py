@@ -8,8 +8,10 @@ for path normalization, code sample extraction, validation, and other
 common operations.
 """
 
+import fnmatch
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
@@ -17,6 +19,28 @@ from pathvalidate import sanitize_filename as _pathvalidate_sanitize_filename
 
 from .types import CodeLanguage, CodeSample, ValidationError
 
+# Fenced code blocks with a language; captures language, optional title on the same line and code content
+_CODE_BLOCK_RE = re.compile(r"```(\w+)(?: ([^\n]+))?\n(.*?)\n```", re.DOTALL)
+
+# Common code fence aliases mapped to our supported language values
+_LANGUAGE_ALIASES: dict[str, str] = {
+    "bash": "curl",  # bash blocks containing curl commands
+    "shell": "curl",  # shell blocks containing curl commands
+    "sh": "curl",  # sh blocks containing curl commands
+    "js": "javascript",  # js alias for javascript
+    "ts": "typescript",  # ts alias for typescript
+    "py": "python",  # py alias for python
+    "c#": "csharp",  # c# alias for csharp
+}
+
+# Line patterns for endpoint/section parsing, compiled once at import
+_ENDPOINT_PATH_HEADER_RE = re.compile(r"^#{2,3}\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+/")
+_ENDPOINT_LINE_RE = re.compile(r"^(#{2,3})\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+(.+)")
+_HEADER_RE = re.compile(r"^(#{1,})\s+")
+_CODE_EXAMPLES_HEADER_RE = re.compile(r"^#{4,}\s+code\s+examples?", re.IGNORECASE)
+_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_SECTION_LINE_RE = re.compile(r"^Section:\s*(.+)", re.IGNORECASE)
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -67,6 +91,27 @@ def normalize_path(path: str, base_path: Optional[str] = None) -> str:
     return os.path.abspath(os.path.expanduser(path))
 
 
+@lru_cache(maxsize=128)
+def _code_language_from_tag(tag: str) -> Optional[CodeLanguage]:
+    """
+    Map a code fence language tag to a CodeLanguage, resolving common aliases.
+
+    Docs repeat a handful of tags across every block, so lookups are cached per tag.
+
+    Args:
+        tag: Language tag from the opening code fence
+
+    Returns:
+        The matching CodeLanguage, or None if the language is not supported
+    """
+    language_str = tag.lower()
+    language_str = _LANGUAGE_ALIASES.get(language_str, language_str)
+    try:
+        return CodeLanguage(language_str)
+    except ValueError:
+        return None
+
+
 def extract_code_samples(
     markdown_content: str, supported_languages: Optional[list[CodeLanguage]] = None
 ) -> list[CodeSample]:
@@ -85,34 +130,12 @@ def extract_code_samples(
     """
     code_samples = []
 
-    # Pattern to match fenced code blocks with language specification
-    # Captures: language, optional title on same line (space-separated), and code content
-    pattern = r"```(\w+)(?: ([^\n]+))?\n(.*?)\n```"
-
-    for match in re.finditer(pattern, markdown_content, re.DOTALL):
-        language_str = match.group(1).lower()
+    for match in _CODE_BLOCK_RE.finditer(markdown_content):
         title = match.group(2)
         code = match.group(3).strip()
 
-        # Map common language aliases to our supported languages
-        language_mapping = {
-            "bash": "curl",  # bash blocks containing curl commands
-            "shell": "curl",  # shell blocks containing curl commands
-            "sh": "curl",  # sh blocks containing curl commands
-            "js": "javascript",  # js alias for javascript
-            "ts": "typescript",  # ts alias for typescript
-            "py": "python",  # py alias for python
-            "c#": "csharp",  # c# alias for csharp
-        }
-
-        # Apply language mapping
-        if language_str in language_mapping:
-            language_str = language_mapping[language_str]
-
-        # Validate language
-        try:
-            language = CodeLanguage(language_str)
-        except ValueError:
+        language = _code_language_from_tag(match.group(1))
+        if language is None:
             # Skip unsupported languages
             continue
 
@@ -150,17 +173,9 @@ def validate_markdown_structure(markdown_content: str, file_path: Optional[str]
 
     for i, line in enumerate(lines, 1):
         # Check for endpoint headers (## GET /path or ### POST /path)
-        if re.match(r"^#{2,3}\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+/", line):
+        if not has_endpoint_header and _ENDPOINT_PATH_HEADER_RE.match(line):
             has_endpoint_header = True
 
-        # Check for description sections
-        if re.match(r"^#{3,4}\s+(Description|Summary)", line, re.IGNORECASE):
-            pass
-
-        # Check for example sections
-        if re.match(r"^#{3,4}\s+(Example|Sample|Code)", line, re.IGNORECASE):
-            pass
-
         # Validate code block syntax
         if line.strip().startswith("```"):
             if not _validate_code_block(lines, i - 1):
@@ -220,13 +235,13 @@ def extract_endpoint_info(markdown_content: str, general_docs_content: Optional[
         # Collect Overview content until next h2
         if in_overview:
             # Check if this is an endpoint header first
-            endpoint_match = re.match(r"^(#{2,3})\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+(.+)", line)
+            endpoint_match = _ENDPOINT_LINE_RE.match(line)
             if endpoint_match:
                 # This is an endpoint header, stop overview collection
                 in_overview = False
                 # Don't continue, let this line be processed by the endpoint logic below
             else:
-                header_match = re.match(r"^(#{1,})\s+", line)
+                header_match = _HEADER_RE.match(line)
                 if header_match:
                     current_header_level = len(header_match.group(1))
                     # Stop overview collection if we hit another h2 or h1
@@ -248,7 +263,7 @@ def extract_endpoint_info(markdown_content: str, general_docs_content: Optional[
                     continue
 
         # Extract endpoint from header (only take the first one found)
-        endpoint_match = re.match(r"^(#{2,3})\s+(GET|POST|PUT|PATCH|DELETE|HEAD|OPTIONS)\s+(.+)", line)
+        endpoint_match = _ENDPOINT_LINE_RE.match(line)
         if endpoint_match and not endpoint_info["method"]:
             endpoint_header_level = len(endpoint_match.group(1))  # Count the # characters
             endpoint_info["method"] = endpoint_match.group(2)
@@ -261,14 +276,14 @@ def extract_endpoint_info(markdown_content: str, general_docs_content: Optional[
         # Collect description content (everything between endpoint header and next section)
         if in_description and found_endpoint:
             # Check if this line should stop description collection
-            header_match = re.match(r"^(#{1,})\s+", line)
+            header_match = _HEADER_RE.match(line)
             if header_match:
                 current_header_level = len(header_match.group(1))
                 header_text = line.strip()
 
                 # Stop collection for code examples sections, but allow request examples and response examples
                 # This prevents code samples from being included in the description while keeping request/response examples
-                if re.match(r"^#{4,}\s+code\s+examples?", header_text, re.IGNORECASE):
+                if _CODE_EXAMPLES_HEADER_RE.match(header_text):
                     in_description = False
                     # Don't add this line to description since it's the start of a code examples section
                     continue
@@ -292,11 +307,11 @@ def extract_endpoint_info(markdown_content: str, general_docs_content: Optional[
                 # Clean up summary - remove markdown formatting for summary
                 summary = line.strip()
                 # Remove bold formatting for summary
-                summary = re.sub(r"\*\*(.*?)\*\*", r"\1", summary)
+                summary = _BOLD_RE.sub(r"\1", summary)
                 endpoint_info["summary"] = summary
 
         # Extract sections from metadata
-        section_match = re.match(r"^Section:\s*(.+)", line, re.IGNORECASE)
+        section_match = _SECTION_LINE_RE.match(line)
         if section_match:
             sections = [section.strip() for section in section_match.group(1).split(",")]
             endpoint_info["sections"] = sections
@@ -335,7 +350,8 @@ def find_markdown_files(directory: str, patterns: Optional[list[str]] = None, re
 
     Args:
         directory: Directory to search in
-        patterns: File patterns to match (default: ['*.md', '*.markdown'])
+        patterns: File patterns to match (default: ['*.md', '*.markdown']); patterns
+            containing '/' are matched against the path relative to directory
         recursive: Whether to search recursively
 
     Returns:
@@ -344,16 +360,44 @@ def find_markdown_files(directory: str, patterns: Optional[list[str]] = None, re
     if patterns is None:
         patterns = ["*.md", "*.markdown"]
 
-    directory_path = Path(directory)
-    markdown_files: list[Path] = []
+    # Patterns with a directory part (e.g. "api/*.md") need the path relative to the root,
+    # so they are handed to Path.glob/rglob; plain file-name patterns use the walk below
+    name_patterns = [pattern for pattern in patterns if "/" not in pattern]
+    path_patterns = [pattern for pattern in patterns if "/" in pattern]
+
+    markdown_files: list[str] = []
+    pending = [directory] if name_patterns else []
+
+    # Walk with os.scandir so the DirEntry type cache answers is_dir()/is_file() without
+    # extra stat() calls, and every name pattern is checked in a single pass over the tree.
+    # Like Path.rglob, symlinked files are listed but symlinked directories are not
+    # descended into, so a link back up the tree cannot repeat files or loop.
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.is_file() and any(fnmatch.fnmatch(entry.name, pattern) for pattern in name_patterns):
+                        markdown_files.append(entry.path)
+        except OSError:
+            # Missing or unreadable directories contribute no files
+            continue
 
-    for pattern in patterns:
-        if recursive:
-            markdown_files.extend(directory_path.rglob(pattern))
-        else:
-            markdown_files.extend(directory_path.glob(pattern))
+    if path_patterns:
+        listed = set(markdown_files)
+        directory_path = Path(directory)
+        for pattern in path_patterns:
+            matches = directory_path.rglob(pattern) if recursive else directory_path.glob(pattern)
+            for match in matches:
+                file_path = str(match)
+                if file_path not in listed and match.is_file():
+                    listed.add(file_path)
+                    markdown_files.append(file_path)
 
-    return [str(f) for f in markdown_files]
+    return markdown_files
 
 
 def _extract_code_description(content: str, code_start: int) -> Optional[str]:
@@ -367,16 +411,20 @@ def _extract_code_description(content: str, code_start: int) -> Optional[str]:
     Returns:
         Description text if found
     """
-    # Look backwards from code block to find preceding paragraph
-    preceding_text = content[:code_start].strip()
-
-    # Get the last paragraph before the code block
-    paragraphs = preceding_text.split("\n\n")
-    if paragraphs:
-        last_paragraph = paragraphs[-1].strip()
-        # Skip if it's a header or empty
-        if last_paragraph and not last_paragraph.startswith("#"):
-            return last_paragraph
+    # Look backwards from the code block, skipping trailing whitespace
+    end = code_start
+    while end > 0 and content[end - 1].isspace():
+        end -= 1
+
+    # Only the last paragraph is needed, so scan back to the previous blank line instead of
+    # splitting everything before the block (which made extraction quadratic in file size)
+    paragraph_start = content.rfind("\n\n", 0, end)
+    paragraph_start = 0 if paragraph_start == -1 else paragraph_start + 2
+    last_paragraph = content[paragraph_start:end].strip()
+
+    # Skip if it's a header or empty
+    if last_paragraph and not last_paragraph.startswith("#"):
+        return last_paragraph
 
     return None
 
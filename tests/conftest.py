@@ -6,35 +6,20 @@ Pytest configuration and shared fixtures for FastMarkDocs tests.
 This module provides common fixtures and configuration used across all tests.
 """
 
-import os
-import shutil
-import sys
-import tempfile
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Union
 
 import pytest
-from fastapi import FastAPI
-from fastapi.routing import APIRoute
 
-from fastmarkdocs import CodeLanguage, HTTPMethod
+from fastmarkdocs import CodeLanguage, DocumentationData, HTTPMethod, MarkdownDocumentationLoader
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+if TYPE_CHECKING:
+    # Imported lazily below, so test runs that never build an app skip the FastAPI import chain
+    from fastapi import FastAPI
 
-
-@pytest.fixture
-def temp_docs_dir() -> Any:
-    """Create a temporary directory for test documentation files."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    shutil.rmtree(temp_dir)
-
-
-@pytest.fixture
-def sample_markdown_content() -> str:
-    """Sample markdown content for testing."""
-    return """
+# Markdown fixture documents, built once at import and shared by the fixtures below
+_SAMPLE_MARKDOWN = """
 # API Documentation
 
 ## GET /api/users
@@ -185,11 +170,7 @@ curl -X GET "https://api.example.com/api/users/1" \\
 Section: users, details
 """
 
-
-@pytest.fixture
-def complex_markdown_content() -> str:
-    """Complex markdown content with edge cases for testing."""
-    return """
+_COMPLEX_MARKDOWN = """
 # Complex API Documentation
 
 ## POST /api/auth/login
@@ -359,11 +340,7 @@ curl -X DELETE "https://api.example.com/api/users/123" \\
 Section: users, delete, admin
 """
 
-
-@pytest.fixture
-def malformed_markdown_content():
-    """Malformed markdown content for testing error handling."""
-    return """
+_MALFORMED_MARKDOWN = """
 # Malformed Documentation
 
 ## GET /api/broken
@@ -394,6 +371,51 @@ import requests
 This section is incomplete and should be handled gracefully.
 """
 
+# UTF-8 encodings of the documents above, so fixture files are written without re-encoding
+_SAMPLE_MARKDOWN_BYTES = _SAMPLE_MARKDOWN.encode("utf-8")
+
+
+@pytest.fixture
+def temp_docs_dir(tmp_path: Path) -> Path:
+    """Temporary directory for test documentation files; pytest prunes old ones itself."""
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def sample_markdown_content() -> str:
+    """Sample markdown content for testing."""
+    return _SAMPLE_MARKDOWN
+
+
+@pytest.fixture(scope="session")
+def sample_markdown_bytes() -> bytes:
+    """Sample markdown content, pre-encoded as UTF-8."""
+    return _SAMPLE_MARKDOWN_BYTES
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_docs(tmp_path_factory: pytest.TempPathFactory) -> DocumentationData:
+    """
+    The sample markdown loaded through MarkdownDocumentationLoader, parsed once per session.
+
+    For tests that only inspect the parsed result; treat it as read-only.
+    """
+    docs_dir = tmp_path_factory.mktemp("sample_docs")
+    (docs_dir / "api.md").write_bytes(_SAMPLE_MARKDOWN_BYTES)
+    return MarkdownDocumentationLoader(docs_directory=str(docs_dir), cache_enabled=False).load_documentation()
+
+
+@pytest.fixture(scope="session")
+def complex_markdown_content() -> str:
+    """Complex markdown content with edge cases for testing."""
+    return _COMPLEX_MARKDOWN
+
+
+@pytest.fixture(scope="session")
+def malformed_markdown_content():
+    """Malformed markdown content for testing error handling."""
+    return _MALFORMED_MARKDOWN
+
 
 @pytest.fixture
 def sample_openapi_schema():
@@ -513,9 +535,15 @@ def sample_openapi_schema():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_fastapi_app():
-    """Create a mock FastAPI application for testing."""
+    """
+    Create a mock FastAPI application for testing.
+
+    Built once per session; tests must not add routes to it or otherwise modify it.
+    """
+    from fastapi import FastAPI
+
     app = FastAPI(title="Test API", version="1.0.0", description="Test application")
 
     # Add some mock routes
@@ -581,10 +609,9 @@ def openapi_enhancement_config():
     }
 
 
-@pytest.fixture
-def sample_endpoint_documentation():
-    """Sample endpoint documentation structure."""
-    return {
+# Read-only sample endpoint; the top level is a mappingproxy so accidental writes raise TypeError
+_SAMPLE_ENDPOINT_DOCUMENTATION = MappingProxyType(
+    {
         "path": "/api/users",
         "method": HTTPMethod.GET,
         "summary": "List all users",
@@ -623,6 +650,17 @@ def sample_endpoint_documentation():
         "tags": ["users", "list"],
         "deprecated": False,
     }
+)
+
+
+@pytest.fixture(scope="session")
+def sample_endpoint_documentation():
+    """
+    Sample endpoint documentation structure.
+
+    Read-only; tests that need to modify it should work on a copy.deepcopy.
+    """
+    return _SAMPLE_ENDPOINT_DOCUMENTATION
 
 
 # Test utilities
@@ -630,23 +668,29 @@ class TestUtils:
     """Utility functions for tests."""
 
     @staticmethod
-    def create_markdown_file(temp_dir: Path, filename: str, content: str) -> Path:
-        """Create a markdown file with the given content."""
+    def create_markdown_file(temp_dir: Path, filename: str, content: Union[str, bytes]) -> Path:
+        """Create a markdown file with the given content; bytes are written as-is, text as UTF-8."""
         file_path = temp_dir / filename
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        # Only nested filenames need a mkdir; temp_dir itself already exists
+        if file_path.parent != temp_dir:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+        else:
+            file_path.write_text(content, encoding="utf-8")
         return file_path
 
     @staticmethod
-    def extract_app_routes(app: FastAPI) -> set[tuple[str, str]]:
+    def extract_app_routes(app: "FastAPI") -> set[tuple[str, str]]:
         """Extract all routes from a FastAPI application."""
-        routes = set()
-        for route in app.routes:
-            if isinstance(route, APIRoute):
-                for method in route.methods:
-                    if method != "OPTIONS":
-                        routes.add((method, route.path))
-        return routes
+        from fastapi.routing import APIRoute
+
+        return {
+            (method, route.path)
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods - {"OPTIONS"}
+        }
 
     @staticmethod
     def normalize_whitespace(text: str) -> str:
@@ -654,7 +698,7 @@ class TestUtils:
         return " ".join(text.split())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_utils() -> None:
     """Provide test utilities."""
     return TestUtils
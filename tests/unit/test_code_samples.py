@@ -11,7 +11,7 @@ import pytest
 
 from fastmarkdocs.code_samples import CodeSampleGenerator
 from fastmarkdocs.exceptions import CodeSampleGenerationError
-from fastmarkdocs.types import CodeLanguage, EndpointDocumentation, HTTPMethod
+from fastmarkdocs.types import CodeLanguage, CodeSample, EndpointDocumentation, HTTPMethod
 
 
 class TestCodeSampleGenerator:
@@ -130,6 +130,47 @@ class TestCodeSampleGenerator:
         assert CodeLanguage.PYTHON in languages
         assert CodeLanguage.JAVASCRIPT in languages
 
+    def test_generate_samples_for_endpoints(self) -> None:
+        """Test batch generation matches per-endpoint generation, in input order."""
+        generator = CodeSampleGenerator(code_sample_languages=[CodeLanguage.CURL, CodeLanguage.PYTHON])
+
+        endpoints = [
+            EndpointDocumentation(path="/api/users", method=HTTPMethod.GET, summary="List users"),
+            EndpointDocumentation(path="/api/users/{user_id}", method=HTTPMethod.DELETE, summary="Delete user"),
+        ]
+
+        samples = generator.generate_samples_for_endpoints(endpoints)
+
+        expected = [sample for endpoint in endpoints for sample in generator.generate_samples_for_endpoint(endpoint)]
+        assert samples == expected
+        assert len(samples) == 4
+
+    def test_generate_samples_for_endpoints_skip_failed(self) -> None:
+        """Test that skip_failed warns about and skips failing endpoints instead of raising."""
+        generator = CodeSampleGenerator(code_sample_languages=[CodeLanguage.CURL])
+        original_curl_generation = generator.generate_curl_sample
+
+        def curl_generation_failing_on_bad_path(endpoint: EndpointDocumentation, **kwargs: Any) -> CodeSample:
+            if endpoint.path == "/bad":
+                raise ValueError("Curl generation failed")
+            return original_curl_generation(endpoint, **kwargs)
+
+        generator.generate_curl_sample = curl_generation_failing_on_bad_path  # type: ignore[method-assign]
+
+        endpoints = [
+            EndpointDocumentation(path="/good", method=HTTPMethod.GET),
+            EndpointDocumentation(path="/bad", method=HTTPMethod.GET),
+        ]
+
+        with pytest.raises(CodeSampleGenerationError):
+            generator.generate_samples_for_endpoints(endpoints)
+
+        with pytest.warns(UserWarning, match="GET:/bad"):
+            samples = generator.generate_samples_for_endpoints(endpoints, skip_failed=True)
+
+        assert len(samples) == 1
+        assert "/good" in samples[0].code
+
     def test_generate_samples_with_path_parameters(self) -> None:
         """Test generating samples with path parameters."""
         generator = CodeSampleGenerator()
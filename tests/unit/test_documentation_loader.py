@@ -45,16 +45,9 @@ class TestMarkdownDocumentationLoader:
         with pytest.raises(DocumentationLoadError):
             MarkdownDocumentationLoader(docs_directory="/nonexistent/directory")
 
-    def test_load_documentation_success(
-        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
-    ) -> None:
+    def test_load_documentation_success(self, parsed_sample_docs: Any) -> None:
         """Test successful documentation loading."""
-        # Create test markdown file
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
-
-        loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=False)
-
-        documentation = loader.load_documentation()
+        documentation = parsed_sample_docs
 
         assert documentation is not None
         assert len(documentation.endpoints) > 0
@@ -67,6 +60,43 @@ class TestMarkdownDocumentationLoader:
         assert get_users_endpoint is not None
         assert "users" in get_users_endpoint.summary.lower()
 
+    def test_load_documentation_from_sources(self, sample_markdown_content: Any) -> None:
+        """Test loading documentation from in-memory sources without touching the filesystem."""
+        loader = MarkdownDocumentationLoader(
+            docs_directory="/nonexistent/directory",
+            sources={"api.md": sample_markdown_content, "notes.txt": "## GET /ignored\n\nNot markdown."},
+            cache_enabled=False,
+        )
+
+        documentation = loader.load_documentation()
+
+        assert documentation.metadata["stats"].total_files == 1
+        get_users_endpoint = next(
+            (ep for ep in documentation.endpoints if ep.path == "/api/users" and ep.method == HTTPMethod.GET), None
+        )
+        assert get_users_endpoint is not None
+        assert "users" in get_users_endpoint.summary.lower()
+        assert all(ep.path != "/ignored" for ep in documentation.endpoints)
+
+    def test_load_documentation_from_sources_matches_files(
+        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+    ) -> None:
+        """Test that in-memory sources parse the same way as the equivalent files on disk."""
+        general_docs = "# General\n\nShared API information."
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "general_docs.md", general_docs)
+
+        file_loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=False)
+        source_loader = MarkdownDocumentationLoader(
+            sources={"api.md": sample_markdown_content, "general_docs.md": general_docs}, cache_enabled=False
+        )
+
+        from_files = file_loader.load_documentation()
+        from_sources = source_loader.load_documentation()
+
+        assert from_sources.endpoints == from_files.endpoints
+        assert source_loader._general_docs_content == file_loader._general_docs_content
+
     def test_load_documentation_empty_directory(self, temp_docs_dir: Any) -> None:
         """Test loading documentation from empty directory."""
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=False)
@@ -77,10 +107,10 @@ class TestMarkdownDocumentationLoader:
         assert len(documentation.endpoints) == 0
 
     def test_load_documentation_with_caching(
-        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+        self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
     ) -> None:
         """Test documentation loading with caching enabled."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=True)
 
@@ -93,9 +123,9 @@ class TestMarkdownDocumentationLoader:
         # Should be the same object reference due to caching
         assert documentation1 is documentation2
 
-    def test_clear_cache(self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any) -> None:
+    def test_clear_cache(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test cache clearing functionality."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=True)
 
@@ -110,11 +140,9 @@ class TestMarkdownDocumentationLoader:
 
         assert documentation1 is not documentation2
 
-    def test_parse_markdown_file_success(
-        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
-    ) -> None:
+    def test_parse_markdown_file_success(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test parsing a single markdown file."""
-        file_path = test_utils.create_markdown_file(temp_docs_dir, "test.md", sample_markdown_content)
+        file_path = test_utils.create_markdown_file(temp_docs_dir, "test.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir))
         endpoints = loader._parse_markdown_file(file_path)
@@ -244,17 +272,15 @@ Another endpoint without proper structure.
         assert "users" in get_users.sections
         assert "list" in get_users.sections
 
-    def test_recursive_directory_loading(
-        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
-    ) -> None:
+    def test_recursive_directory_loading(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test recursive loading of markdown files from subdirectories."""
         # Create nested directory structure
         subdir = temp_docs_dir / "api" / "v1"
         subdir.mkdir(parents=True)
 
         # Create files in different directories
-        test_utils.create_markdown_file(temp_docs_dir, "root.md", sample_markdown_content)
-        test_utils.create_markdown_file(subdir, "users.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "root.md", sample_markdown_bytes)
+        test_utils.create_markdown_file(subdir, "users.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), recursive=True, cache_enabled=False)
 
@@ -264,7 +290,7 @@ Another endpoint without proper structure.
         assert len(documentation.endpoints) > 3  # More than one file's worth
 
     def test_non_recursive_directory_loading(
-        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+        self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
     ) -> None:
         """Test non-recursive loading (only root directory)."""
         # Create nested directory structure
@@ -272,8 +298,8 @@ Another endpoint without proper structure.
         subdir.mkdir(parents=True)
 
         # Create files in different directories
-        test_utils.create_markdown_file(temp_docs_dir, "root.md", sample_markdown_content)
-        test_utils.create_markdown_file(subdir, "users.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "root.md", sample_markdown_bytes)
+        test_utils.create_markdown_file(subdir, "users.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), recursive=False, cache_enabled=False)
 
@@ -282,12 +308,12 @@ Another endpoint without proper structure.
         # Should only find endpoints from root file
         assert len(documentation.endpoints) == 3  # Only from root.md
 
-    def test_file_pattern_filtering(self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any) -> None:
+    def test_file_pattern_filtering(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test filtering files by pattern."""
         # Create files with different extensions
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
         test_utils.create_markdown_file(temp_docs_dir, "readme.txt", "Not markdown")
-        test_utils.create_markdown_file(temp_docs_dir, "docs.markdown", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "docs.markdown", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(
             docs_directory=str(temp_docs_dir), file_patterns=["*.md"], cache_enabled=False
@@ -520,9 +546,9 @@ curl -X GET "https://api.example.com/api/endpoint{i}"
         assert len(results) == 3
         assert all(result is results[0] for result in results)
 
-    def test_cache_ttl_expiration(self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any) -> None:
+    def test_cache_ttl_expiration(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test cache TTL expiration functionality."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         # Use very short TTL for testing
         loader = MarkdownDocumentationLoader(
@@ -543,9 +569,9 @@ curl -X GET "https://api.example.com/api/endpoint{i}"
         # Should be different objects due to cache expiration
         assert documentation1 is not documentation2
 
-    def test_concurrent_cache_loading(self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any) -> None:
+    def test_concurrent_cache_loading(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test thread-safe cache loading with multiple threads."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=True)
 
@@ -756,9 +782,9 @@ Test endpoint with frontmatter
         # Should no longer be cached due to modified time
         assert not loader._is_cached(str(test_file))
 
-    def test_get_stats_functionality(self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any) -> None:
+    def test_get_stats_functionality(self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any) -> None:
         """Test statistics gathering functionality."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=True)
 
@@ -833,10 +859,10 @@ Get specific user
         assert "GET /api/users/{id}" in sections[2]
 
     def test_concurrent_loading_with_cache_failure_recovery(
-        self, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+        self, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
     ) -> None:
         """Test recovery when concurrent loading fails and waiting threads need to retry."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir), cache_enabled=True)
 
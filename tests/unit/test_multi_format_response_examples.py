@@ -414,7 +414,3 @@ class TestResponseExampleValidation:
         # Should fall back to plain text for malformed JSON
         assert example.content_type == "text/plain"
         assert example.content == malformed_json
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
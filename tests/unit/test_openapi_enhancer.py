@@ -5,11 +5,13 @@ Tests the OpenAPI schema enhancement functionality including code sample generat
 response example integration, and documentation enhancement.
 """
 
+import json
 from typing import Any, Union
 from unittest.mock import Mock, patch
 
 import pytest
 
+from fastmarkdocs.documentation_loader import MarkdownDocumentationLoader
 from fastmarkdocs.exceptions import OpenAPIEnhancementError
 from fastmarkdocs.openapi_enhancer import OpenAPIEnhancer, enhance_openapi_with_docs
 from fastmarkdocs.types import (
@@ -80,6 +82,31 @@ class TestOpenAPIEnhancer:
         assert stats["endpoints_enhanced"] >= 1
         assert stats["total_endpoints"] == 1
 
+    def test_enhance_openapi_schema_does_not_modify_input(self, sample_openapi_schema: Any) -> None:
+        """Test that enhancement works on a copy and leaves the input schema untouched."""
+        original = json.loads(json.dumps(sample_openapi_schema))
+        documentation_data = DocumentationData(
+            endpoints=[
+                EndpointDocumentation(
+                    path="/api/users",
+                    method=HTTPMethod.GET,
+                    summary="List users",
+                    description="Retrieve a list of users from the system",
+                    code_samples=[
+                        CodeSample(language=CodeLanguage.CURL, code='curl -X GET "https://api.example.com/api/users"')
+                    ],
+                )
+            ],
+            metadata={},
+        )
+
+        enhancer = OpenAPIEnhancer()
+        enhanced_schema = enhancer.enhance_openapi_schema(sample_openapi_schema, documentation_data)
+
+        assert sample_openapi_schema == original
+        assert "x-codeSamples" in enhanced_schema["paths"]["/api/users"]["get"]
+        assert enhanced_schema["paths"] is not sample_openapi_schema["paths"]
+
     def test_enhance_openapi_schema_with_response_examples(self, sample_openapi_schema: Any) -> None:
         """Test OpenAPI schema enhancement with response examples."""
         documentation_data = DocumentationData(
@@ -1018,11 +1045,11 @@ class TestEnhanceOpenAPIWithDocs:
     """Test the enhance_openapi_with_docs convenience function."""
 
     def test_enhance_openapi_with_docs_basic(
-        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
     ) -> None:
         """Test the convenience function with basic usage."""
         # Create test documentation
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         enhanced_schema = enhance_openapi_with_docs(
             openapi_schema=sample_openapi_schema, docs_directory=str(temp_docs_dir)
@@ -1033,10 +1060,10 @@ class TestEnhanceOpenAPIWithDocs:
         assert "/api/users" in enhanced_schema["paths"]
 
     def test_enhance_openapi_with_docs_custom_config(
-        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
     ) -> None:
         """Test the convenience function with custom configuration."""
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         enhanced_schema = enhance_openapi_with_docs(
             openapi_schema=sample_openapi_schema,
@@ -1060,6 +1087,27 @@ class TestEnhanceOpenAPIWithDocs:
         if curl_sample:
             assert "https://custom.api.com" in curl_sample["source"]
 
+    def test_enhance_openapi_with_docs_reuses_docs_loader(
+        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
+    ) -> None:
+        """Test that a supplied loader is used, so its cache is shared across calls."""
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
+        loader = MarkdownDocumentationLoader(docs_directory=str(temp_docs_dir))
+
+        with patch.object(
+            loader, "_load_documentation_internal", wraps=loader._load_documentation_internal
+        ) as mock_load:
+            first = enhance_openapi_with_docs(
+                openapi_schema=sample_openapi_schema, docs_directory=str(temp_docs_dir), docs_loader=loader
+            )
+            second = enhance_openapi_with_docs(
+                openapi_schema=sample_openapi_schema, docs_directory=str(temp_docs_dir), docs_loader=loader
+            )
+
+        assert mock_load.call_count == 1
+        assert "x-codeSamples" in first["paths"]["/api/users"]["get"]
+        assert first["paths"] == second["paths"]
+
     def test_enhance_openapi_with_docs_error_handling(self, sample_openapi_schema: Any) -> None:
         """Test error handling in the convenience function."""
         # Test with non-existent directory
@@ -1203,11 +1251,11 @@ Custom general documentation content.
         assert "Parameters" in endpoint_description_no_general
 
     def test_enhance_openapi_with_docs_app_title_and_description(
-        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_content: Any, test_utils: Any
+        self, sample_openapi_schema: Any, temp_docs_dir: Any, sample_markdown_bytes: Any, test_utils: Any
     ) -> None:
         """Test the app_title and app_description parameters."""
         # Create test documentation
-        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_content)
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", sample_markdown_bytes)
 
         # Test with both app_title and app_description
         enhanced_schema = enhance_openapi_with_docs(
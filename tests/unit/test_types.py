@@ -5,6 +5,9 @@ Tests the various data classes, enums, and type definitions used throughout
 the FastMarkDocs library.
 """
 
+import sys
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from fastmarkdocs.types import (
@@ -35,6 +38,8 @@ class TestEnums:
         assert CodeLanguage.JAVASCRIPT.value == "javascript"
         assert CodeLanguage.CURL.value == "curl"
         assert str(CodeLanguage.PYTHON) == "python"
+        assert f"{CodeLanguage.CURL}" == "curl"
+        assert type(str(CodeLanguage.CURL)) is str
 
     def test_http_method_enum(self) -> None:
         """Test HTTPMethod enum values and string representation."""
@@ -42,6 +47,8 @@ class TestEnums:
         assert HTTPMethod.POST.value == "POST"
         assert HTTPMethod.PUT.value == "PUT"
         assert str(HTTPMethod.GET) == "GET"
+        assert f"{HTTPMethod.POST}" == "POST"
+        assert len(HTTPMethod) == 7
 
 
 class TestDataClasses:
@@ -191,6 +198,12 @@ class TestDataClasses:
         assert endpoint.parameters == []
         assert endpoint.sections == []
 
+    def test_endpoint_documentation_path_prefix(self) -> None:
+        """Test EndpointDocumentation.path_prefix returns the first path segment."""
+        assert EndpointDocumentation(path="/v1/session/{id}", method=HTTPMethod.GET).path_prefix == "/v1"
+        assert EndpointDocumentation(path="/health", method=HTTPMethod.GET).path_prefix == "/health"
+        assert EndpointDocumentation(path="users", method=HTTPMethod.GET).path_prefix == "users"
+
     def test_endpoint_documentation_empty_path_validation(self) -> None:
         """Test EndpointDocumentation validation with empty path."""
         with pytest.raises(ValueError) as exc_info:
@@ -226,12 +239,16 @@ class TestDataClasses:
 
     def test_documentation_data_dictionary_access(self) -> None:
         """Test DocumentationData dictionary-style access."""
-        doc_data = DocumentationData(endpoints=[], global_examples=[], metadata={"test": "value"})
+        doc_data = DocumentationData(
+            endpoints=[], global_examples=[], metadata={"test": "value"}, section_descriptions={"Users": "User ops"}
+        )
 
         # Test valid keys
         assert doc_data["endpoints"] == []
         assert doc_data["global_examples"] == []
         assert doc_data["metadata"] == {"test": "value"}
+        assert doc_data["section_descriptions"] == {"Users": "User ops"}
+        assert doc_data["tag_descriptions"] is doc_data.section_descriptions
 
         # Test invalid key
         with pytest.raises(KeyError) as exc_info:
@@ -300,6 +317,37 @@ class TestDataClasses:
         assert error.message == "Invalid syntax"
         assert error.suggestion == "Fix the syntax"
 
+    def test_validation_error_is_frozen_and_interned(self) -> None:
+        """Test ValidationError is immutable and shares strings for repeated error types."""
+        error_type = "".join(["missing_", "section"])
+        first = ValidationError(file_path="a.md", line_number=None, error_type=error_type, message="Missing")
+        second = ValidationError(file_path="a.md", line_number=None, error_type="missing_section", message="Missing")
+
+        assert first.error_type is second.error_type
+        assert first == second
+        assert len({first, second}) == 1
+
+        with pytest.raises(FrozenInstanceError):
+            first.message = "Changed"  # type: ignore[misc]
+
+    def test_parameter_documentation_is_frozen(self) -> None:
+        """Test ParameterDocumentation is immutable."""
+        param = ParameterDocumentation(name="user_id", description="User ID", type="int")
+
+        with pytest.raises(FrozenInstanceError):
+            param.required = True  # type: ignore[misc]
+
+    def test_parameter_documentation_accepts_str_subclasses(self) -> None:
+        """Test that str subclass names and types are kept rather than interned."""
+
+        class Name(str):
+            pass
+
+        param = ParameterDocumentation(name=Name("user_id"), description="User ID", type=Name("int"))
+
+        assert param.name == "user_id"
+        assert param.type == "int"
+
     def test_documentation_stats_creation(self) -> None:
         """Test DocumentationStats creation."""
         validation_error = ValidationError(
@@ -407,3 +455,15 @@ class TestDataClasses:
         """Test TagDescription validation with empty description."""
         with pytest.raises(ValueError, match="Tag description cannot be empty"):
             TagDescription(name="users", description="")
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_dataclasses_are_slotted(self) -> None:
+        """Test that data classes use __slots__ instead of a per-instance __dict__."""
+        sample = CodeSample(language=CodeLanguage.CURL, code="curl https://api.example.com")
+        endpoint = EndpointDocumentation(path="/users", method=HTTPMethod.GET, code_samples=[sample])
+
+        for instance in (sample, endpoint, DocumentationData(endpoints=[endpoint])):
+            assert not hasattr(instance, "__dict__")
+
+        with pytest.raises(AttributeError):
+            sample.unknown_field = "value"  # type: ignore[attr-defined]
@@ -10,8 +10,11 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
+import pytest
+
 from fastmarkdocs.types import CodeLanguage
 from fastmarkdocs.utils import (
+    _code_language_from_tag,
     _extract_code_description,
     _validate_code_block,
     extract_code_samples,
@@ -142,6 +145,13 @@ curl -X GET "https://api.example.com"
         assert CodeLanguage.PYTHON in languages  # py -> python
         assert CodeLanguage.CURL in languages  # bash -> curl
 
+    def test_code_language_from_tag(self) -> None:
+        """Test fence tag to CodeLanguage mapping, including aliases and unsupported tags."""
+        assert _code_language_from_tag("Python") == CodeLanguage.PYTHON
+        assert _code_language_from_tag("sh") == CodeLanguage.CURL
+        assert _code_language_from_tag("ts") == CodeLanguage.TYPESCRIPT
+        assert _code_language_from_tag("unsupported") is None
+
     def test_extract_code_samples_unsupported_language(self) -> None:
         """Test code sample extraction with unsupported languages."""
         markdown = """
@@ -235,6 +245,13 @@ response = requests.get("/api/users")
         # Should have minimal errors for valid structure (may have some warnings)
         assert len(errors) <= 1
 
+    def test_validate_markdown_structure_accepts_path(self) -> None:
+        """Test that a Path file_path is accepted and reported on the errors."""
+        errors = validate_markdown_structure("```python\nprint('unclosed')", Path("x.md"))
+
+        assert errors
+        assert all(error.file_path == Path("x.md") for error in errors)
+
     def test_validate_markdown_structure_missing_endpoints(self) -> None:
         """Test markdown structure validation with missing endpoints."""
         invalid_markdown = """
@@ -425,6 +442,41 @@ Create a new user.
         txt_files = [f for f in files if f.endswith(".txt")]
         assert len(txt_files) >= 1
 
+    def test_find_markdown_files_lists_each_file_once(self, temp_docs_dir: Any, test_utils: Any) -> None:
+        """Test that files matching several patterns are listed once and directories are skipped."""
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", "# API")
+        (temp_docs_dir / "archive.md").mkdir()
+
+        files = find_markdown_files(str(temp_docs_dir), patterns=["*.md", "api.*"])
+
+        assert files == [str(temp_docs_dir / "api.md")]
+
+    def test_find_markdown_files_does_not_follow_directory_symlinks(self, temp_docs_dir: Any, test_utils: Any) -> None:
+        """Test that a symlink cycle back up the tree does not repeat files."""
+        test_utils.create_markdown_file(temp_docs_dir, "api.md", "# API")
+        try:
+            (temp_docs_dir / "loop").symlink_to(temp_docs_dir, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks are not supported on this filesystem")
+
+        files = find_markdown_files(str(temp_docs_dir))
+
+        assert files == [str(temp_docs_dir / "api.md")]
+
+    def test_find_markdown_files_pattern_with_directory(self, temp_docs_dir: Any, test_utils: Any) -> None:
+        """Test that patterns with a directory part match the path relative to the root."""
+        test_utils.create_markdown_file(temp_docs_dir, "api/users.md", "# Users")
+        test_utils.create_markdown_file(temp_docs_dir, "v2/api/orders.md", "# Orders")
+        test_utils.create_markdown_file(temp_docs_dir, "guides/intro.md", "# Intro")
+
+        files = find_markdown_files(str(temp_docs_dir), patterns=["api/*.md"])
+        assert sorted(files) == sorted(
+            [str(temp_docs_dir / "api" / "users.md"), str(temp_docs_dir / "v2/api/orders.md")]
+        )
+
+        files = find_markdown_files(str(temp_docs_dir), patterns=["api/*.md"], recursive=False)
+        assert files == [str(temp_docs_dir / "api" / "users.md")]
+
     def test_find_markdown_files_nonexistent_directory(self) -> None:
         """Test markdown file finding with non-existent directory."""
         files = find_markdown_files("/nonexistent/directory")